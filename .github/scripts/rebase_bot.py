@@ -3,42 +3,35 @@ import subprocess
 import sys
 
 
-def run(cmd: str):
-    print(f"+ {cmd}")
-    subprocess.run(cmd, shell=True, check=True)
+def run(args: list[str]):
+    print(f"+ {' '.join(args)}")
+    subprocess.run(args, check=True)
 
 
 def main():
     base = os.environ["BASE_BRANCH"]
     head = os.environ["HEAD_BRANCH"]
 
-    run("git config user.name 'github-actions[bot]'")
-    run("git config user.email '41898282+github-actions[bot]@users.noreply.github.com'")
+    run(["git", "config", "user.name", "github-actions[bot]"])
+    run(["git", "config", "user.email", "41898282+github-actions[bot]@users.noreply.github.com"])
 
     # Fetch base branch
-    run(f"git fetch origin {base}")
+    run(["git", "fetch", "origin", base])
 
-    # Rebase
+    # Rebase, formatting every replayed commit in place rather than patching
+    # only the tip with a trailing fmt commit
+    # The braces scope the || to the diff check; an ungrouped chain would fall
+    # through to the amend (exit 0) when cargo fmt itself fails
+    fmt_exec = "cargo fmt && git update-index -q --refresh && { git diff --quiet || git commit -a --amend --no-edit; }"
     try:
-        run(f"git rebase origin/{base}")
+        run(["git", "rebase", "--exec", fmt_exec, f"origin/{base}"])
     except subprocess.CalledProcessError:
         print("❌ Rebase conflict, aborting")
-        run("git rebase --abort")
+        run(["git", "rebase", "--abort"])
         sys.exit(1)
 
-    # Run cargo fmt
-    run("cargo fmt")
-
-    # Commit fmt changes if any
-    status = subprocess.check_output("git status --porcelain", shell=True).decode().strip()
-    if status:
-        run("git add .")
-        run("git commit -m 'chore: cargo fmt'")
-    else:
-        print("✔ No formatting changes")
-
     # Force push back to PR branch
-    run(f"git push origin HEAD:{head} --force-with-lease")
+    run(["git", "push", "origin", f"HEAD:{head}", "--force-with-lease"])
 
     print("✅ Rebase & format completed")
 
@@ -1,35 +1,44 @@
 import os
-from playwright.sync_api import sync_playwright
+from concurrent.futures import ThreadPoolExecutor
+from pygments import highlight
+from pygments.formatters import ImageFormatter
+from pygments.lexers import TextLexer, get_lexer_by_name
+from pygments.util import ClassNotFound
 
 def generate_text_screenshot(content, output_path, title=""):
-    html_content = f"""
-    <html>
-    <head>
-        <style>
-            body {{ font-family: monospace; background-color: #1e1e1e; color: #d4d4d4; padding: 20px; }}
-            pre {{ margin: 0; }}
-            .title {{ font-weight: bold; margin-bottom: 10px; color: #569cd6; }}
-        </style>
-    </head>
-    <body>
-        <div class="title">{title}</div>
-        <pre>{content}</pre>
-    </body>
-    </html>
-    """
+    # Render in-process; headless Chromium added nothing for a <pre> block
+    if title:
+        content = f"// {title}\n\n{content}"
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 800, "height": 600})
-        page.set_content(html_content)
-
-        # Calculate height
-        bbox = page.locator("body").bounding_box()
-        height = bbox["height"] + 40
-        page.set_viewport_size({"width": 800, "height": int(height)})
-
-        page.screenshot(path=output_path)
-        browser.close()
+    try:
+        lexer = get_lexer_by_name("kdl")
+    except ClassNotFound:
+        lexer = TextLexer()
+
+    formatter = ImageFormatter(
+        style="monokai",
+        font_name="DejaVu Sans Mono",
+        line_numbers=False,
+        image_pad=20,
+    )
+    with open(output_path, "wb") as f:
+        f.write(highlight(content, lexer, formatter))
+
+def extract_block(text, marker):
+    """Return the brace-delimited block starting at `marker`, or the whole text."""
+    start = text.find(marker)
+    if start < 0:
+        return text
+    depth = 0
+    for i in range(start, len(text)):
+        c = text[i]
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return text
 
 def read_file_content(filepath):
     try:
@@ -44,8 +53,10 @@ def get_tree(path):
     output = []
     output.append(f"{path}/")
     try:
-        # Filter first to ensure is_last logic works correctly
-        items = sorted([x for x in os.listdir(path) if x.endswith(".kdl")])
+        # Filter first to ensure is_last logic works correctly; scandir gives
+        # cached entry metadata in one pass instead of a listdir + stat per entry
+        with os.scandir(path) as it:
+            items = sorted(e.name for e in it if e.is_file(follow_symlinks=False) and e.name.endswith(".kdl"))
         for i, item in enumerate(items):
             is_last = i == len(items) - 1
             prefix = "└── " if is_last else "├── "
@@ -55,69 +66,27 @@ def get_tree(path):
     return "\n".join(output)
 
 def main():
-    # 1. Finance Project Structure
-    finance_tree = get_tree("gurih-finance")
-    generate_text_screenshot(finance_tree, "docs/images/finance-project-structure.png", "Project Structure")
-
-    # 2. Finance DSL Example (Journal)
-    journal_content = read_file_content("gurih-finance/journal.kdl")
-
-    # Extract workflow block
-    lines = journal_content.splitlines()
-    workflow_lines = []
-    in_workflow = False
-    brace_count = 0
-    for line in lines:
-        if "workflow \"JournalWorkflow\"" in line:
-            in_workflow = True
-
-        if in_workflow:
-            workflow_lines.append(line)
-            brace_count += line.count("{")
-            brace_count -= line.count("}")
-            if brace_count == 0:
-                break
-
-    if workflow_lines:
-        dsl_content = "\n".join(workflow_lines)
-    else:
-        dsl_content = journal_content # Fallback
-
-    generate_text_screenshot(dsl_content, "docs/images/finance-dsl-example.png", "gurih-finance/journal.kdl")
-
-    # 3. Finance Integration Example
-    integration_content = read_file_content("gurih-finance/integration.kdl")
-    generate_text_screenshot(integration_content, "docs/images/finance-integration.png", "gurih-finance/integration.kdl")
-
-    # 4. SIASN Project Structure
-    siasn_tree = get_tree("gurih-siasn")
-    generate_text_screenshot(siasn_tree, "docs/images/siasn-project-structure.png", "Project Structure")
-
-    # 5. SIASN DSL Example (Workflow)
-    workflow_content = read_file_content("gurih-siasn/workflow.kdl")
-
-    # Extract workflow block
-    lines = workflow_content.splitlines()
-    status_lines = []
-    in_status = False
-    brace_count = 0
-    for line in lines:
-        if "workflow \"PegawaiStatusWorkflow\"" in line:
-            in_status = True
-
-        if in_status:
-            status_lines.append(line)
-            brace_count += line.count("{")
-            brace_count -= line.count("}")
-            if brace_count == 0:
-                break
-
-    if status_lines:
-        dsl_content = "\n".join(status_lines)
-    else:
-        dsl_content = workflow_content
-
-    generate_text_screenshot(dsl_content, "docs/images/siasn-dsl-example.png", "gurih-siasn/workflow.kdl")
+    jobs = [
+        # 1. Finance Project Structure
+        (get_tree("gurih-finance"),
+         "docs/images/finance-project-structure.png", "Project Structure"),
+        # 2. Finance DSL Example (Journal workflow block)
+        (extract_block(read_file_content("gurih-finance/journal.kdl"), 'workflow "JournalWorkflow"'),
+         "docs/images/finance-dsl-example.png", "gurih-finance/journal.kdl"),
+        # 3. Finance Integration Example
+        (read_file_content("gurih-finance/integration.kdl"),
+         "docs/images/finance-integration.png", "gurih-finance/integration.kdl"),
+        # 4. SIASN Project Structure
+        (get_tree("gurih-siasn"),
+         "docs/images/siasn-project-structure.png", "Project Structure"),
+        # 5. SIASN DSL Example (Workflow block)
+        (extract_block(read_file_content("gurih-siasn/workflow.kdl"), 'workflow "PegawaiStatusWorkflow"'),
+         "docs/images/siasn-dsl-example.png", "gurih-siasn/workflow.kdl"),
+    ]
+
+    # The renders are independent, so overlap the rasterize/encode/write work
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        list(ex.map(lambda job: generate_text_screenshot(*job), jobs))
 
 if __name__ == "__main__":
     main()
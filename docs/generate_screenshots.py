@@ -1,77 +1,67 @@
+import asyncio
+import socket
 import subprocess
 import time
 import os
 import signal
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 
-def run_finance_screenshots():
+async def wait_port(port, timeout=30):
+    # Poll until the server accepts TCP connections instead of sleeping a fixed amount
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.25).close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise TimeoutError(f"Server did not start listening on port {port} within {timeout}s")
+
+async def capture(page, name, url, path):
+    print(f"Capturing {name}...")
+    try:
+        await page.goto(url, timeout=10000)
+        # Wait for the app to actually settle instead of sleeping a guessed amount
+        await page.wait_for_load_state("networkidle", timeout=10000)
+        try:
+            await page.wait_for_selector("table, canvas", state="visible", timeout=3000)
+        except Exception:
+            pass # Not every view renders a table/chart; networkidle is enough
+        await page.screenshot(path=path)
+    except Exception as e:
+        print(f"Failed to capture {name}: {e}")
+
+async def run_finance_screenshots(context, port=3000):
     print("Starting GurihFinance...")
     # Start the server with --no-auth
     process = subprocess.Popen(
-        ["./target/debug/gurih_cli", "run", "gurih-finance/gurih.kdl", "--port", "3000", "--no-auth"],
+        ["./target/debug/gurih_cli", "run", "gurih-finance/gurih.kdl", "--port", str(port), "--no-auth"],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         preexec_fn=os.setsid
     )
 
-    # Wait for server to start
-    print("Waiting for server to start...")
-    time.sleep(15)
+    shots = [
+        ("Finance Dashboard", f"http://localhost:{port}/#/", "docs/images/finance-dashboard.png"),
+        ("CoA List", f"http://localhost:{port}/#/finance/coa", "docs/images/finance-coa-list.png"),
+        ("Journal List", f"http://localhost:{port}/#/finance/journals", "docs/images/finance-journal-list.png"),
+        ("Trial Balance", f"http://localhost:{port}/#/finance/reports/trial-balance", "docs/images/finance-report-trial-balance.png"),
+    ]
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(viewport={"width": 1280, "height": 800})
-
-            # Inject fake user into localStorage to bypass frontend login screen
-            context.add_init_script("""
-                localStorage.setItem('user', JSON.stringify({
-                    token: 'dummy-token',
-                    username: 'admin',
-                    roles: ['Admin'],
-                    user_id: '1'
-                }));
-            """)
-
-            page = context.new_page()
-
-            # 1. Dashboard
-            print("Capturing Finance Dashboard...")
-            try:
-                page.goto("http://localhost:3000/#/", timeout=10000)
-                page.wait_for_timeout(3000) # Wait for widgets to load
-                page.screenshot(path="docs/images/finance-dashboard.png")
-            except Exception as e:
-                print(f"Failed to capture Dashboard: {e}")
-
-            # 2. CoA List
-            print("Capturing CoA List...")
-            try:
-                page.goto("http://localhost:3000/#/finance/coa", timeout=10000)
-                page.wait_for_timeout(2000)
-                page.screenshot(path="docs/images/finance-coa-list.png")
-            except Exception as e:
-                 print(f"Failed to capture CoA: {e}")
-
-            # 3. Journal List
-            print("Capturing Journal List...")
-            try:
-                page.goto("http://localhost:3000/#/finance/journals", timeout=10000)
-                page.wait_for_timeout(2000)
-                page.screenshot(path="docs/images/finance-journal-list.png")
-            except Exception as e:
-                print(f"Failed to capture Journal: {e}")
-
-            # 4. Reports (Trial Balance)
-            print("Capturing Trial Balance...")
-            try:
-                page.goto("http://localhost:3000/#/finance/reports/trial-balance", timeout=10000)
-                page.wait_for_timeout(2000)
-                page.screenshot(path="docs/images/finance-report-trial-balance.png")
-            except Exception as e:
-                print(f"Failed to capture Report: {e}")
-
-            browser.close()
+        # Wait for server to start; inside the try so a startup timeout still
+        # tears the server down in the finally
+        print("Waiting for server to start...")
+        await wait_port(port)
+
+        # One page per screenshot so the waits overlap instead of adding up
+        pages = [await context.new_page() for _ in shots]
+        await asyncio.gather(*(
+            capture(page, name, url, path)
+            for page, (name, url, path) in zip(pages, shots)
+        ))
+        for page in pages:
+            await page.close()
     except Exception as e:
         print(f"Error capturing Finance: {e}")
     finally:
@@ -82,64 +72,33 @@ def run_finance_screenshots():
         except Exception as e:
             print(f"Error killing process: {e}")
 
-def run_siasn_screenshots():
+async def run_siasn_screenshots(context, port=3000):
     print("Starting GurihSIASN...")
     # Start the server with --no-auth
     process = subprocess.Popen(
-        ["./target/debug/gurih_cli", "run", "gurih-siasn/app.kdl", "--port", "3000", "--no-auth"],
+        ["./target/debug/gurih_cli", "run", "gurih-siasn/app.kdl", "--port", str(port), "--no-auth"],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         preexec_fn=os.setsid
     )
 
-    print("Waiting for server to start...")
-    time.sleep(15)
+    shots = [
+        ("SIASN Dashboard", f"http://localhost:{port}/#/", "docs/images/siasn-dashboard.png"),
+        ("Pegawai List", f"http://localhost:{port}/#/kepegawaian/pegawai", "docs/images/siasn-pegawai-list.png"),
+        ("Cuti List", f"http://localhost:{port}/#/cuti/pengajuan", "docs/images/siasn-cuti-list.png"),
+    ]
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(viewport={"width": 1280, "height": 800})
-
-            # Inject fake user
-            context.add_init_script("""
-                localStorage.setItem('user', JSON.stringify({
-                    token: 'dummy-token',
-                    username: 'admin',
-                    roles: ['Admin'],
-                    user_id: '1'
-                }));
-            """)
-
-            page = context.new_page()
-
-            # 1. Dashboard
-            print("Capturing SIASN Dashboard...")
-            try:
-                page.goto("http://localhost:3000/#/", timeout=10000)
-                page.wait_for_timeout(3000)
-                page.screenshot(path="docs/images/siasn-dashboard.png")
-            except Exception as e:
-                print(f"Failed to capture Dashboard: {e}")
-
-            # 2. Pegawai List
-            print("Capturing Pegawai List...")
-            try:
-                page.goto("http://localhost:3000/#/kepegawaian/pegawai", timeout=10000)
-                page.wait_for_timeout(2000)
-                page.screenshot(path="docs/images/siasn-pegawai-list.png")
-            except Exception as e:
-                print(f"Failed to capture Pegawai: {e}")
-
-            # 3. Cuti List
-            print("Capturing Cuti List...")
-            try:
-                page.goto("http://localhost:3000/#/cuti/pengajuan", timeout=10000)
-                page.wait_for_timeout(2000)
-                page.screenshot(path="docs/images/siasn-cuti-list.png")
-            except Exception as e:
-                print(f"Failed to capture Cuti: {e}")
-
-            browser.close()
+        print("Waiting for server to start...")
+        await wait_port(port)
+
+        pages = [await context.new_page() for _ in shots]
+        await asyncio.gather(*(
+            capture(page, name, url, path)
+            for page, (name, url, path) in zip(pages, shots)
+        ))
+        for page in pages:
+            await page.close()
     except Exception as e:
         print(f"Error capturing SIASN: {e}")
     finally:
@@ -150,7 +109,43 @@ def run_siasn_screenshots():
         except Exception as e:
              print(f"Error killing process: {e}")
 
+async def main():
+    # Persistent profile so HTTP/code caches survive between runs; the
+    # browsers themselves are cached via PLAYWRIGHT_BROWSERS_PATH in CI.
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(
+            ".cache/pw-profile",
+            headless=True,
+            viewport={"width": 1280, "height": 800},
+        )
+
+        # Screenshots only need the app itself; skip external fonts/media so
+        # networkidle settles sooner
+        async def block_nonessential(route):
+            request = route.request
+            if request.resource_type in {"font", "media", "websocket"} and "localhost" not in request.url:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", block_nonessential)
+
+        # Inject fake user into localStorage to bypass frontend login screen
+        await context.add_init_script("""
+            localStorage.setItem('user', JSON.stringify({
+                token: 'dummy-token',
+                username: 'admin',
+                roles: ['Admin'],
+                user_id: '1'
+            }));
+        """)
+
+        # Different ports, so both servers can run at the same time
+        await asyncio.gather(
+            run_finance_screenshots(context, port=3000),
+            run_siasn_screenshots(context, port=3001),
+        )
+        await context.close()
+
 if __name__ == "__main__":
-    run_finance_screenshots()
-    time.sleep(5)
-    run_siasn_screenshots()
+    asyncio.run(main())